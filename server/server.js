@@ -7,6 +7,8 @@ const fs = require('fs');
 const QRCode = require('qrcode');
 const os = require('os');
 const dgram = require('dgram');
+const zlib = require('zlib');
+const { pipeline } = require('stream');
 
 const app = express();
 const server = http.createServer(app);
@@ -481,9 +483,13 @@ app.get('/mesh', (req, res) => {
     return res.status(404).json({ error: 'Mesh not available yet' });
   }
 
-  // Get file stats for ETag
+  // Serve gzip only when the client accepts it (honours q-values such as gzip;q=0)
+  const useGzip = req.acceptsEncodings('gzip', 'identity') === 'gzip';
+
+  // Get file stats for ETag (the gzip representation gets its own validator)
   const stats = fs.statSync(meshPath);
-  const etag = `"${stats.mtime.getTime()}-${stats.size}"`;
+  const etagBase = `${stats.mtime.getTime()}-${stats.size}`;
+  const etag = useGzip ? `"${etagBase}-gz"` : `"${etagBase}"`;
   
   // Check if client has cached version
   const ifNoneMatch = req.headers['if-none-match'];
@@ -496,16 +502,35 @@ app.get('/mesh', (req, res) => {
   res.setHeader('ETag', etag);
   res.setHeader('Cache-Control', 'no-cache');
   res.setHeader('Last-Modified', stats.mtime.toUTCString());
+  res.setHeader('Vary', 'Accept-Encoding');
 
-  // Stream the file
   const fileStream = fs.createReadStream(meshPath);
-  fileStream.pipe(res);
-  
-  fileStream.on('error', (err) => {
-    console.error(`[HTTP] Error streaming mesh for token ${token}:`, err);
+
+  // The worker may replace latest.ply between statSync and open; report that as a plain JSON error
+  const onOpenError = (err) => {
+    console.error(`[HTTP] Error opening mesh for token ${token}:`, err);
     if (!res.headersSent) {
       res.status(500).json({ error: 'Failed to stream mesh' });
     }
+  };
+  fileStream.once('error', onOpenError);
+
+  // Stream the file once it is open, gzip-compressed when negotiated
+  fileStream.once('open', () => {
+    fileStream.removeListener('error', onOpenError);
+
+    const streams = [fileStream];
+    if (useGzip) {
+      res.setHeader('Content-Encoding', 'gzip');
+      streams.push(zlib.createGzip({ level: zlib.constants.Z_BEST_SPEED }));
+    }
+
+    // pipeline destroys every stream (including res) on failure, so the client sees an aborted response
+    pipeline(...streams, res, (err) => {
+      if (err) {
+        console.error(`[HTTP] Error streaming mesh for token ${token}:`, err);
+      }
+    });
   });
 });
 